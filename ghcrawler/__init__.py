@@ -1,4 +1,5 @@
 from .cli import main
 from .crawler import SUPPORTED_TYPES, CrawlerConfig, GitHubCrawler
+from .seen_store import SeenStore, open_seen_store
 
-__all__ = ["CrawlerConfig", "GitHubCrawler", "SUPPORTED_TYPES", "main"]
+__all__ = ["CrawlerConfig", "GitHubCrawler", "SUPPORTED_TYPES", "SeenStore", "main", "open_seen_store"]
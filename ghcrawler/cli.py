@@ -1,7 +1,9 @@
 import argparse
 import json
+import sys
 
 from .crawler import SUPPORTED_TYPES, CrawlerConfig, GitHubCrawler
+from .seen_store import PERSISTENT_SEEN_STORE_KINDS
 
 
 def main(argv=None):
@@ -11,17 +13,56 @@ def main(argv=None):
     p.add_argument("--type", choices=sorted(SUPPORTED_TYPES), required=True, help="Repositories | Issues | Wikis")
     p.add_argument("--timeout", type=int, default=20)
     p.add_argument("--extra", action="store_true", help="Include owner + language_stats (Repositories only)")
+    p.add_argument(
+        "--owners",
+        action="store_true",
+        help="Like --extra, plus owner profile and per-owner language totals (Repositories only)",
+    )
+    p.add_argument(
+        "--seen-store",
+        choices=sorted(PERSISTENT_SEEN_STORE_KINDS),
+        help="Skip URLs returned by earlier runs: bloom | sqlite (persisted at --seen-path)",
+    )
+    p.add_argument("--seen-path", help="File backing the --seen-store (required with it)")
+    p.add_argument("--bloom-error-rate", type=float, help="Bloom store false-positive rate (default: 0.001)")
+    p.add_argument(
+        "--warm-connections",
+        type=int,
+        default=0,
+        help="Pre-open this many connections per proxy before searching (default: 0)",
+    )
+    p.add_argument("--no-dns-cache", action="store_true", help="Resolve hosts on every new connection")
+    p.add_argument("--connection-stats", action="store_true", help="Print connection reuse/DNS stats to stderr")
     args = p.parse_args(argv)
 
+    if args.seen_store and not args.seen_path:
+        p.error(f"--seen-store {args.seen_store} requires --seen-path")
+    if args.seen_path and not args.seen_store:
+        p.error("--seen-path requires --seen-store")
+    if args.bloom_error_rate is not None and args.seen_store != "bloom":
+        p.error("--bloom-error-rate requires --seen-store bloom")
+
     cfg = CrawlerConfig(
         keywords=args.keywords,
         proxies=args.proxies,
         type=args.type,
         timeout=args.timeout,
         include_extra=args.extra,
+        include_owners=args.owners,
+        seen_store_kind=args.seen_store,
+        seen_path=args.seen_path,
+        bloom_error_rate=args.bloom_error_rate if args.bloom_error_rate is not None else 0.001,
+        warm_connections=args.warm_connections,
+        dns_cache=not args.no_dns_cache,
     )
-    data = GitHubCrawler(cfg).run()
+    crawler = GitHubCrawler(cfg)
+    try:
+        data = crawler.run()
+    finally:
+        crawler.close()
     print(json.dumps(data, ensure_ascii=False, indent=2))
+    if args.connection_stats:
+        print(json.dumps(crawler.connection_stats(), indent=2), file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import socket
+import threading
+from socket import timeout as SocketTimeout
+from typing import Any, Dict, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    NameResolutionError,
+    NewConnectionError,
+)
+from urllib3.util import connection, parse_url
+
+DIRECT = "direct"
+
+# Probe idle pooled sockets after a minute instead of the kernel default (2 hours on
+# Linux), so NATs and proxies see traffic between requests. The TCP_KEEP* knobs are
+# only set where the platform exposes them; elsewhere just SO_KEEPALIVE applies.
+KEEPALIVE_IDLE_SECONDS = 60
+KEEPALIVE_INTERVAL_SECONDS = 15
+KEEPALIVE_PROBES = 4
+
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+] + [
+    (socket.IPPROTO_TCP, getattr(socket, name), value)
+    for name, value in (
+        ("TCP_KEEPIDLE", KEEPALIVE_IDLE_SECONDS),
+        ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL_SECONDS),
+        ("TCP_KEEPCNT", KEEPALIVE_PROBES),
+    )
+    if hasattr(socket, name)
+]
+
+
+class DnsCache:
+    """Resolved addresses per (host, port), shared by the connections of one adapter.
+
+    Concurrent misses on the same host wait for a single lookup. Failed lookups
+    are not cached; clear() drops everything so a new run resolves afresh.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Dict[Tuple[str, int], List[str]] = {}
+        self._key_locks: Dict[Tuple[str, int], threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        key = (host, port)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    self.hits += 1
+                    return cached
+            infos = socket.getaddrinfo(host, port, connection.allowed_gai_family(), socket.SOCK_STREAM)
+            addresses = list(dict.fromkeys(info[4][0] for info in infos))
+            with self._lock:
+                self._cache[key] = addresses
+                self.misses += 1
+            return addresses
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._key_locks.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"lookups": self.misses, "hits": self.hits}
+
+
+class _DnsCachingConnectionMixin:
+    """Opens the socket to a cached address instead of resolving the host on every connect.
+
+    Only the TCP target changes; `host` (SNI, certificate checks, Host header) is untouched.
+    """
+
+    dns_cache: DnsCache
+
+    def _new_conn(self) -> socket.socket:
+        try:
+            addresses = self.dns_cache.resolve(self._dns_host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+
+        error: Optional[Exception] = None
+        for address in addresses:
+            try:
+                return connection.create_connection(
+                    (address, self.port),
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options,
+                )
+            except SocketTimeout as e:
+                error = ConnectTimeoutError(
+                    self, f"Connection to {self.host} timed out. (connect timeout={self.timeout})"
+                )
+                error.__cause__ = e
+            except OSError as e:
+                error = NewConnectionError(self, f"Failed to establish a new connection: {e}")
+                error.__cause__ = e
+        raise error or NewConnectionError(self, f"No addresses resolved for {self.host}")
+
+
+def _dns_caching_pool_classes(dns_cache: DnsCache) -> Dict[str, type]:
+    """Pool classes whose connections resolve through dns_cache, for one PoolManager."""
+    pool_classes = {}
+    for scheme, pool_cls, conn_cls in (
+        ("http", HTTPConnectionPool, HTTPConnection),
+        ("https", HTTPSConnectionPool, HTTPSConnection),
+    ):
+        cached_conn_cls = type(
+            f"DnsCaching{conn_cls.__name__}", (_DnsCachingConnectionMixin, conn_cls), {"dns_cache": dns_cache}
+        )
+        pool_classes[scheme] = type(f"DnsCaching{pool_cls.__name__}", (pool_cls,), {"ConnectionCls": cached_conn_cls})
+    return pool_classes
+
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose direct and per-proxy pools all use TCP keep-alive sockets.
+
+    With a DnsCache, connections opened by this adapter (direct, to proxies and
+    through tunnels) resolve hosts through it; nothing process-wide is patched.
+    """
+
+    def __init__(self, *args: Any, dns_cache: Optional[DnsCache] = None, **kwargs: Any) -> None:
+        self.dns_cache = dns_cache
+        self._pool_classes = _dns_caching_pool_classes(dns_cache) if dns_cache is not None else None
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any) -> None:
+        pool_kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        if self._pool_classes is not None:
+            self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        proxy_kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if self._pool_classes is not None:
+            manager.pool_classes_by_scheme = self._pool_classes
+        return manager
+
+
+def _pool_totals(pools: Any) -> Dict[str, int]:
+    requests_made = connections = 0
+    for key in pools.keys():
+        pool = pools[key]
+        requests_made += pool.num_requests
+        connections += pool.num_connections
+    return {"requests": requests_made, "connections": connections}
+
+
+def _with_reuse_ratio(totals: Dict[str, int]) -> Dict[str, Any]:
+    made = totals["requests"]
+    reuse = 1 - totals["connections"] / made if made else 0.0
+    return {**totals, "reuse_ratio": round(max(0.0, reuse), 3)}
+
+
+def pool_stats(adapter: HTTPAdapter) -> Dict[str, Dict[str, Any]]:
+    """Requests, new connections and reuse ratio per route ("direct" or proxy URL) plus "total".
+
+    Counts come from the live urllib3 pools, so pools already evicted are not included.
+    """
+    routes = {DIRECT: _pool_totals(adapter.poolmanager.pools)}
+    for proxy, manager in adapter.proxy_manager.items():
+        # Route names are printed, so drop any user:password from the proxy URL.
+        routes[parse_url(proxy)._replace(auth=None).url] = _pool_totals(manager.pools)
+
+    total = {
+        "requests": sum(r["requests"] for r in routes.values()),
+        "connections": sum(r["connections"] for r in routes.values()),
+    }
+    stats = {route: _with_reuse_ratio(totals) for route, totals in routes.items() if totals["requests"]}
+    stats["total"] = _with_reuse_ratio(total)
+    return stats
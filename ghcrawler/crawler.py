@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util import Retry, Timeout
 
-from .parsers import extract_search_urls, parse_language_stats
+from .connections import DnsCache, KeepAliveAdapter, pool_stats
+from .parsers import extract_search_urls, parse_language_stats, parse_owner_profile
+from .seen_store import SeenStore, open_seen_store
 
 SUPPORTED_TYPES = {"Repositories", "Issues", "Wikis"}
 
+WARM_UP_URL = "https://github.com/"
+# Warm-up must not delay the first search: dead routes get one short connect attempt.
+WARM_UP_CONNECT_TIMEOUT = 3.0
+
 
 @dataclass
 class CrawlerConfig:
@@ -22,7 +28,13 @@ class CrawlerConfig:
     type: str
     timeout: int = 20
     include_extra: bool = False
+    include_owners: bool = False
     concurrency: int = 16
+    seen_store_kind: Optional[str] = None
+    seen_path: Optional[str] = None
+    bloom_error_rate: float = 0.001
+    warm_connections: int = 0
+    dns_cache: bool = True
     user_agent: str = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -31,21 +43,30 @@ class CrawlerConfig:
 
 
 class GitHubCrawler:
-    def __init__(self, config: CrawlerConfig):
+    def __init__(self, config: CrawlerConfig, seen_store: Optional[SeenStore] = None):
         if config.type not in SUPPORTED_TYPES:
             raise ValueError(f"Unsupported search type: {config.type}")
         if not config.keywords:
             raise ValueError("At least one keyword is required")
         self.config = config
+        self.dns_cache = DnsCache() if config.dns_cache else None
         self.session = self._build_session(config)
         self.proxies = config.proxies or []
+        # URLs returned by earlier successful runs; consulted before enrichment is queued.
+        # Without a configured store every run() is independent.
+        if seen_store is None and config.seen_store_kind is not None:
+            seen_store = open_seen_store(config.seen_store_kind, config.seen_path, config.bloom_error_rate)
+        self.seen: Optional[SeenStore] = seen_store
 
     def _build_session(self, cfg: CrawlerConfig) -> requests.Session:
         s = requests.Session()
         s.headers.update({"User-Agent": cfg.user_agent, "Accept-Language": "en-US,en;q=0.9"})
-        # Pool size ~ concurrency, with retries/backoff for transient GitHub responses
-        pool = max(4, int(cfg.concurrency))
-        adapter = HTTPAdapter(
+        # Pool size ~ concurrency, with retries/backoff for transient GitHub responses.
+        # Each proxy gets its own pools from the adapter; all sockets use TCP keep-alive
+        # and, unless disabled, resolve hosts through this crawler's DNS cache.
+        pool = self._pool_size(cfg)
+        adapter = KeepAliveAdapter(
+            dns_cache=self.dns_cache,
             pool_connections=pool,
             pool_maxsize=pool,
             max_retries=Retry(
@@ -60,14 +81,21 @@ class GitHubCrawler:
         s.mount("https://", adapter)
         return s
 
-    def _choose_proxy(self) -> Optional[Dict[str, str]]:
-        if not self.proxies:
-            return None
-        proxy = random.choice(self.proxies)
+    @staticmethod
+    def _pool_size(cfg: CrawlerConfig) -> int:
+        return max(4, int(cfg.concurrency))
+
+    @staticmethod
+    def _proxy_map(proxy: str) -> Dict[str, str]:
         if "://" not in proxy:
             proxy = f"http://{proxy}"
         return {"http": proxy, "https": proxy}
 
+    def _choose_proxy(self) -> Optional[Dict[str, str]]:
+        if not self.proxies:
+            return None
+        return self._proxy_map(random.choice(self.proxies))
+
     def _fetch(self, url: str) -> str:
         try:
             r = self.session.get(url, proxies=self._choose_proxy(), timeout=self.config.timeout)
@@ -76,15 +104,87 @@ class GitHubCrawler:
         except requests.RequestException as e:
             raise RuntimeError(f"HTTP error fetching {url}: {e}") from e
 
+    def warm_up(self) -> None:
+        """Open and TLS-handshake up to `warm_connections` pooled connections per proxy.
+
+        Connections are opened concurrently so each lands in the pool as a separate
+        keep-alive socket. Each HEAD gets a single attempt with a short connect timeout;
+        failures are ignored and surface on the real fetch instead.
+        """
+        per_route = min(int(self.config.warm_connections), self._pool_size(self.config))
+        if per_route <= 0:
+            return
+        routes = [self._proxy_map(p) for p in self.proxies] or [None]
+
+        jobs = [route for route in routes for _ in range(per_route)]
+        with ThreadPoolExecutor(max_workers=max(per_route, int(self.config.concurrency))) as tp:
+            list(tp.map(self._open_warm_connection, jobs))
+
+    def _open_warm_connection(self, proxies: Optional[Dict[str, str]]) -> None:
+        # Go straight to the adapter's urllib3 pool: the socket stays in the pool the
+        # crawler fetches from, but without the session's Retry/backoff policy.
+        # Environment settings (HTTPS_PROXY, REQUESTS_CA_BUNDLE, ...) are merged exactly
+        # as session.get does, so the warmed pool is the one _fetch will pick.
+        adapter = self.session.get_adapter(WARM_UP_URL)
+        request = requests.Request("HEAD", WARM_UP_URL).prepare()
+        timeout = Timeout(connect=min(WARM_UP_CONNECT_TIMEOUT, self.config.timeout), read=self.config.timeout)
+        try:
+            settings = self.session.merge_environment_settings(WARM_UP_URL, proxies or {}, False, None, None)
+            pool = adapter.get_connection_with_tls_context(
+                request, verify=settings["verify"], proxies=settings["proxies"], cert=settings["cert"]
+            )
+            response = pool.urlopen(
+                "HEAD",
+                adapter.request_url(request, settings["proxies"]),
+                headers=dict(self.session.headers),
+                retries=False,
+                redirect=False,
+                assert_same_host=False,
+                timeout=timeout,
+                preload_content=False,
+            )
+            response.drain_conn()
+            response.release_conn()
+        except (requests.RequestException, Urllib3HTTPError, OSError):
+            pass
+
+    def connection_stats(self) -> Dict[str, Any]:
+        """Connection reuse per route (direct or proxy) and DNS cache hits for this crawler."""
+        stats: Dict[str, Any] = {"pools": pool_stats(self.session.get_adapter("https://"))}
+        if self.dns_cache is not None:
+            stats["dns"] = self.dns_cache.stats()
+        return stats
+
     def run(self) -> List[Dict]:
+        if self.dns_cache is not None:
+            self.dns_cache.clear()
+        self.warm_up()
+        results = self._crawl()
+        self._record_seen(results)
+        return results
+
+    def _record_seen(self, results: List[Dict]) -> None:
+        # Only reached after a run succeeds, so a failed run never marks its URLs as seen.
+        if self.seen is None:
+            return
+        for item in results:
+            self.seen.add(item["url"])
+        self.seen.flush()
+
+    def _crawl(self) -> List[Dict]:
         search_url = self._build_search_url()
         html = self._fetch(search_url)
         urls = extract_search_urls(html, self.config.type)
-        results: List[Dict] = [{"url": u} for u in urls]
+        results: List[Dict] = [{"url": u} for u in urls if self.seen is None or u not in self.seen]
 
-        if self.config.type == "Repositories" and self.config.include_extra and results:
+        include_owners = self.config.include_owners
+        if self.config.type == "Repositories" and (self.config.include_extra or include_owners) and results:
             concurrency = max(1, int(self.config.concurrency))
             enriched: List[Optional[Dict]] = [None] * len(results)
+            # Per-owner running sums, folded in as each repo finishes: one pass, no second walk.
+            language_totals: Dict[str, Dict[str, float]] = {}
+            repo_counts: Dict[str, int] = {}
+            stats_counts: Dict[str, int] = {}
 
             def task(index_url: Tuple[int, str]) -> Tuple[int, Dict]:
                 idx, repo_url = index_url
@@ -99,14 +199,51 @@ class GitHubCrawler:
 
             with ThreadPoolExecutor(max_workers=concurrency) as tp:
                 future_to_idx = {tp.submit(task, (i, item["url"])): i for i, item in enumerate(results)}
+                # Each distinct owner page is fetched once, through the same bounded pool.
+                owner_futures = {}
+                if include_owners:
+                    owners = dict.fromkeys(self._split_owner_repo(item["url"])[0] for item in results)
+                    owner_futures = {owner: tp.submit(self._fetch_owner_profile, owner) for owner in owners}
+
                 for fut in as_completed(future_to_idx):
                     idx, enriched_item = fut.result()
                     enriched[idx] = enriched_item
+                    if include_owners:
+                        extra = enriched_item["extra"]
+                        owner = extra["owner"]
+                        repo_counts[owner] = repo_counts.get(owner, 0) + 1
+                        if extra["language_stats"]:
+                            stats_counts[owner] = stats_counts.get(owner, 0) + 1
+                            totals = language_totals.setdefault(owner, {})
+                            for language, percentage in extra["language_stats"].items():
+                                totals[language] = totals.get(language, 0.0) + percentage
 
-            return [item for item in enriched if item is not None]
+                owner_profiles = {owner: fut.result() for owner, fut in owner_futures.items()}
+
+            for owner, profile in owner_profiles.items():
+                repos_with_stats = stats_counts.get(owner, 0)
+                profile["repos_in_results"] = repo_counts.get(owner, 0)
+                profile["language_stats"] = {
+                    language: round(total / repos_with_stats, 1)
+                    for language, total in language_totals.get(owner, {}).items()
+                }
+
+            items = [item for item in enriched if item is not None]
+            if include_owners:
+                for item in items:
+                    item["extra"]["owner_profile"] = owner_profiles[item["extra"]["owner"]]
+            return items
 
         return results
 
+    def close(self) -> None:
+        if self.seen is not None:
+            self.seen.close()
+
+    def _fetch_owner_profile(self, owner: str) -> Dict:
+        profile = parse_owner_profile(self._fetch(f"https://github.com/{owner}"))
+        return {"login": owner, **profile}
+
     def _build_search_url(self) -> str:
         q = quote_plus(" ".join(self.config.keywords))
         t = quote_plus(self.config.type)
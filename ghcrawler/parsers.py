@@ -1,12 +1,22 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
-from .selectors import LANGUAGE_NAME_SELECTOR, PERCENT_RE, RESERVED_NAMESPACES
+from .selectors import (
+    COUNT_RE,
+    COUNTER_SELECTOR,
+    LANGUAGE_NAME_CLASSES,
+    LANGUAGE_NAME_TAG,
+    OWNER_FOLLOWERS_SELECTOR,
+    OWNER_ORGANIZATION_SELECTOR,
+    OWNER_REPOSITORIES_SELECTOR,
+    PERCENT_RE,
+    RESERVED_NAMESPACES,
+)
 
 GITHUB_BASE_URL = "https://github.com"
 
@@ -78,6 +88,42 @@ def extract_search_urls(html: str, search_type: str) -> List[str]:
     return result_urls
 
 
+def _is_language_name(tag: Tag) -> bool:
+    """Match LANGUAGE_NAME_SELECTOR without soupsieve, which walks up to the root per call."""
+    classes = tag.get("class") or []
+    return tag.name == LANGUAGE_NAME_TAG and all(c in classes for c in LANGUAGE_NAME_CLASSES)
+
+
+def _find_language_spans(list_item: Tag) -> Tuple[Optional[Tag], Optional[str]]:
+    """Return the language name <span> and the first other "NN%" span text of a <li>.
+
+    Walks the subtree depth-first with an explicit stack and stops as soon as both
+    are found, so nested lists do not make every <li> scan its whole subtree.
+    """
+    name_element: Optional[Tag] = None
+    percentage_text: Optional[str] = None
+    stack = list(reversed(list_item.contents))
+
+    while stack:
+        node = stack.pop()
+        if not isinstance(node, Tag):
+            continue
+        stack.extend(reversed(node.contents))
+        if node.name != "span":
+            continue
+        if name_element is None and _is_language_name(node):
+            name_element = node
+            continue
+        if percentage_text is None:
+            text = node.get_text(strip=True)
+            if text.endswith("%"):
+                percentage_text = text[:-1]
+        if name_element is not None and percentage_text is not None:
+            break
+
+    return name_element, percentage_text
+
+
 def parse_language_stats(html: str) -> Dict[str, float]:
     """Parse language usage from a repository page's language stats block.
     Returns a dict of {language: percentage} normalized to sum to 100 (if possible).
@@ -86,19 +132,10 @@ def parse_language_stats(html: str) -> Dict[str, float]:
     stats: Dict[str, float] = {}
 
     for list_item in soup.select("ul li"):
-        name_element = list_item.select_one(LANGUAGE_NAME_SELECTOR)
+        name_element, percentage_text = _find_language_spans(list_item)
         if not name_element:
             continue
 
-        percentage_text = None
-        for span in list_item.find_all("span"):
-            if span is name_element:
-                continue
-            text = span.get_text(strip=True)
-            if text.endswith("%"):
-                percentage_text = text[:-1]
-                break
-
         if percentage_text is None:
             match = re.search(PERCENT_RE, list_item.get_text(" ", strip=True))
             if not match:
@@ -122,3 +159,36 @@ def parse_language_stats(html: str) -> Dict[str, float]:
         return normalized_stats
 
     return stats
+
+
+def _parse_count(text: str) -> Optional[int]:
+    """Parse GitHub's abbreviated counters ("1,234", "1.2k", "3m") into an int."""
+    match = re.search(COUNT_RE, text)
+    if not match:
+        return None
+
+    number = float(match.group(1).replace(",", ""))
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(match.group(2).lower(), 1)
+    return int(round(number * multiplier))
+
+
+def parse_owner_profile(html: str) -> Dict[str, Union[str, Optional[int]]]:
+    """Parse an owner (user or organization) profile page.
+    Returns {"type", "followers", "public_repos"}; counts are None when not shown.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    owner_type = "Organization" if soup.select_one(OWNER_ORGANIZATION_SELECTOR) else "User"
+
+    followers = None
+    followers_link = soup.select_one(OWNER_FOLLOWERS_SELECTOR)
+    if followers_link:
+        followers = _parse_count(followers_link.get_text(" ", strip=True))
+
+    public_repos = None
+    repositories_link = soup.select_one(OWNER_REPOSITORIES_SELECTOR)
+    if repositories_link:
+        counter = repositories_link.select_one(COUNTER_SELECTOR)
+        if counter:
+            public_repos = _parse_count(counter.get("title") or counter.get_text(strip=True))
+
+    return {"type": owner_type, "followers": followers, "public_repos": public_repos}
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from typing import List, Optional, Set
+
+SEEN_STORE_KINDS = {"memory", "bloom", "sqlite"}
+# Kinds that outlive the process when given a path; "memory" is for library use,
+# where one GitHubCrawler runs several searches.
+PERSISTENT_SEEN_STORE_KINDS = {"bloom", "sqlite"}
+
+
+class SeenStore(ABC):
+    """Set of already-seen URLs, shared across queries, pages and (when persistent) runs."""
+
+    @abstractmethod
+    def add(self, url: str) -> bool:
+        """Record url; return True if it was not seen before."""
+
+    @abstractmethod
+    def __contains__(self, url: str) -> bool:
+        """Return True if url was recorded earlier."""
+
+    def flush(self) -> None:
+        """Persist pending state. No-op for in-memory stores."""
+
+    def close(self) -> None:
+        self.flush()
+
+
+class MemorySeenStore(SeenStore):
+    """Exact in-process set; RSS grows with the number of URLs and nothing survives the run."""
+
+    def __init__(self) -> None:
+        self._urls: Set[str] = set()
+
+    def add(self, url: str) -> bool:
+        if url in self._urls:
+            return False
+        self._urls.add(url)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._urls
+
+    def __len__(self) -> int:
+        return len(self._urls)
+
+
+class _BloomFilter:
+    """Fixed-capacity Bloom filter using enhanced double hashing over one blake2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float, count: int = 0):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = count
+
+    def _positions(self, url: str) -> List[int]:
+        digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little")
+        # The cubic term keeps probes independent enough on small bit arrays (Dillinger & Manolios).
+        return [(h1 + i * h2 + (i ** 3 - i) // 6) % self.num_bits for i in range(self.num_hashes)]
+
+    def __contains__(self, url: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(url))
+
+    def add(self, url: str) -> None:
+        for p in self._positions(url):
+            self.bits[p >> 3] |= 1 << (p & 7)
+        self.count += 1
+
+
+class BloomSeenStore(SeenStore):
+    """Scalable Bloom filter (Almeida et al.): bounded memory, no false negatives.
+
+    When the newest filter reaches capacity a larger one is added with a tighter
+    error rate, so the compound false-positive rate stays under `error_rate` however
+    many URLs arrive. A false positive means a new URL is treated as already seen.
+    State is saved to `path` on flush() and reloaded on open, if a path is given.
+    """
+
+    GROWTH = 2
+    TIGHTENING = 0.5
+
+    def __init__(self, path: Optional[str] = None, error_rate: float = 0.001, initial_capacity: int = 100_000):
+        if not 0 < error_rate < 1:
+            raise ValueError("Bloom error rate must be between 0 and 1")
+        if initial_capacity < 1:
+            raise ValueError("Bloom initial capacity must be positive")
+        self.path = path
+        self.error_rate = error_rate
+        self.initial_capacity = initial_capacity
+        self._filters: List[_BloomFilter] = []
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _next_filter(self) -> _BloomFilter:
+        i = len(self._filters)
+        capacity = self.initial_capacity * self.GROWTH ** i
+        error_rate = self.error_rate * (1 - self.TIGHTENING) * self.TIGHTENING ** i
+        return _BloomFilter(capacity, error_rate)
+
+    def add(self, url: str) -> bool:
+        if url in self:
+            return False
+        if not self._filters or self._filters[-1].count >= self._filters[-1].capacity:
+            self._filters.append(self._next_filter())
+        self._filters[-1].add(url)
+        return True
+
+    def __contains__(self, url: str) -> bool:
+        return any(url in f for f in self._filters)
+
+    def __len__(self) -> int:
+        return sum(f.count for f in self._filters)
+
+    def flush(self) -> None:
+        if not self.path:
+            return
+        header = {
+            "error_rate": self.error_rate,
+            "initial_capacity": self.initial_capacity,
+            "filters": [{"capacity": f.capacity, "error_rate": f.error_rate, "count": f.count} for f in self._filters],
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(json.dumps(header).encode("utf-8") + b"\n")
+            for f in self._filters:
+                fh.write(f.bits)
+        os.replace(tmp_path, self.path)
+
+    def _load(self, path: str) -> None:
+        with open(path, "rb") as fh:
+            header = json.loads(fh.readline())
+            if header["error_rate"] != self.error_rate or header["initial_capacity"] != self.initial_capacity:
+                raise ValueError(
+                    f"Bloom store {path} was created with error_rate={header['error_rate']}, "
+                    f"initial_capacity={header['initial_capacity']}"
+                )
+            for meta in header["filters"]:
+                f = _BloomFilter(meta["capacity"], meta["error_rate"], count=meta["count"])
+                if fh.readinto(f.bits) != len(f.bits):
+                    raise ValueError(f"Bloom store {path} is truncated")
+                self._filters.append(f)
+
+
+class SqliteSeenStore(SeenStore):
+    """Exact on-disk set in SQLite; memory stays flat and the set persists across runs."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen_urls (url TEXT PRIMARY KEY) WITHOUT ROWID")
+
+    def add(self, url: str) -> bool:
+        cur = self._conn.execute("INSERT OR IGNORE INTO seen_urls (url) VALUES (?)", (url,))
+        return cur.rowcount == 1
+
+    def __contains__(self, url: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM seen_urls WHERE url = ?", (url,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def flush(self) -> None:
+        self._conn.commit()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+def open_seen_store(kind: str = "memory", path: Optional[str] = None, error_rate: float = 0.001) -> SeenStore:
+    """Build a seen-URL store by name: "memory", "bloom" or "sqlite"."""
+    if kind not in SEEN_STORE_KINDS:
+        raise ValueError(f"Unsupported seen store: {kind}")
+    if kind == "memory":
+        return MemorySeenStore()
+    if kind == "bloom":
+        return BloomSeenStore(path=path, error_rate=error_rate)
+    if not path:
+        raise ValueError("The sqlite seen store requires a path")
+    return SqliteSeenStore(path)
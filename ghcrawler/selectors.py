@@ -4,6 +4,15 @@ RESERVED_NAMESPACES = {
     "site", "about", "login", "settings", "codespaces", "apps",
 }
 
-LANGUAGE_NAME_SELECTOR = "span.color-fg-default.text-bold.mr-1"
+LANGUAGE_NAME_TAG = "span"
+LANGUAGE_NAME_CLASSES = ("color-fg-default", "text-bold", "mr-1")
+LANGUAGE_NAME_SELECTOR = LANGUAGE_NAME_TAG + "".join(f".{c}" for c in LANGUAGE_NAME_CLASSES)
 
 PERCENT_RE = r"([-+]?\d+(?:\.\d+)?)\s*%"
+
+OWNER_ORGANIZATION_SELECTOR = '[itemtype$="schema.org/Organization"]'
+OWNER_FOLLOWERS_SELECTOR = 'a[href*="followers"]'
+OWNER_REPOSITORIES_SELECTOR = 'a[href*="tab=repositories"], a[href$="/repositories"]'
+COUNTER_SELECTOR = "span.Counter"
+
+COUNT_RE = r"(\d[\d,]*(?:\.\d+)?)\s*([kKmM]?)"
@@ -0,0 +1,36 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET/HEAD with "ok" over HTTP/1.1 keep-alive (also as a forwarding proxy)."""
+
+    protocol_version = "HTTP/1.1"
+    body = b"ok"
+
+    def _send_headers(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+
+    def do_GET(self):
+        self._send_headers()
+        self.wfile.write(self.body)
+
+    def do_HEAD(self):
+        self._send_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
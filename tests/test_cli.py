@@ -1,6 +1,8 @@
 import json
 from unittest.mock import Mock, patch
 
+import pytest
+
 from ghcrawler.cli import main
 
 SIMPLE_REPO_HTML = "<html><body><a href='/a/b'>x</a></body></html>"
@@ -85,6 +87,30 @@ def test_cli_main_with_extra(mock_get, capsys):
     data = json.loads(out)
     validate_extra_data(data)
 
+@patch("requests.Session.get")
+def test_cli_main_with_owners(mock_get, capsys):
+    """Test CLI functionality with owner-level enrichment."""
+    mock_get.side_effect = create_side_effect_responses(SEARCH_HTML_WITH_REPO, REPO_HTML_WITH_LANGS)
+    main(["--keywords", "a", "b", "--type", "Repositories", "--owners"])
+    out = capsys.readouterr().out
+    data = json.loads(out)
+    validate_extra_data(data)
+    profile = data[0]["extra"]["owner_profile"]
+    assert profile["login"] == "ownerX"
+    assert profile["repos_in_results"] == 1
+    assert profile["language_stats"] == {"Python": 100.0}
+
+@patch("requests.Session.get")
+def test_cli_main_connection_stats(mock_get, capsys):
+    """Test that --connection-stats reports reuse stats on stderr, keeping stdout JSON."""
+    mock_get.return_value = create_mock_response(SIMPLE_REPO_HTML)
+    main(["--keywords", "a", "--type", "Repositories", "--connection-stats", "--no-dns-cache"])
+    captured = capsys.readouterr()
+    validate_repository_result(json.loads(captured.out))
+    stats = json.loads(captured.err)
+    assert stats["pools"]["total"]["reuse_ratio"] == 0.0
+    assert "dns" not in stats
+
 @patch("requests.Session.get")
 def test_cli_main_issues_search(mock_get, capsys):
     """Test CLI functionality for issues search."""
@@ -109,6 +135,36 @@ def test_cli_main_wikis_search(mock_get, capsys):
     assert len(data) > 0, "Result should not be empty"
     assert data[0]["url"] == "https://github.com/ownerX/repoY/wiki/Home"
 
+@pytest.mark.parametrize(
+    "extra_args, message",
+    [
+        (["--seen-store", "bloom"], "--seen-store bloom requires --seen-path"),
+        (["--seen-store", "sqlite"], "--seen-store sqlite requires --seen-path"),
+        (["--seen-path", "seen.db"], "--seen-path requires --seen-store"),
+        (["--bloom-error-rate", "0.01"], "--bloom-error-rate requires --seen-store bloom"),
+        (["--seen-store", "sqlite", "--seen-path", "s.db", "--bloom-error-rate", "0.01"],
+         "--bloom-error-rate requires --seen-store bloom"),
+        (["--seen-store", "memory"], "invalid choice"),
+    ],
+)
+def test_cli_rejects_ineffective_seen_store_options(extra_args, message, capsys):
+    """Test that seen-store options that would do nothing are rejected."""
+    with pytest.raises(SystemExit) as exc:
+        main(["--keywords", "a", "--type", "Repositories", *extra_args])
+    assert exc.value.code == 2
+    assert message in capsys.readouterr().err
+
+@patch("requests.Session.get")
+def test_cli_seen_store_skips_urls_from_previous_run(mock_get, capsys, tmp_path):
+    """Test that a persisted seen store drops URLs returned by an earlier CLI run."""
+    mock_get.return_value = create_mock_response(SIMPLE_REPO_HTML)
+    argv = ["--keywords", "a", "--type", "Repositories", "--seen-store", "bloom",
+            "--seen-path", str(tmp_path / "seen.bloom"), "--bloom-error-rate", "0.01"]
+    main(argv)
+    validate_repository_result(json.loads(capsys.readouterr().out))
+    main(argv)
+    assert json.loads(capsys.readouterr().out) == []
+
 def test_cli_main_direct_call():
     """Test the if __name__ == '__main__' block"""
     with patch('ghcrawler.cli.main') as mock_main:
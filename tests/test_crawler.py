@@ -1,6 +1,9 @@
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
+import requests
 
 from ghcrawler.crawler import CrawlerConfig, GitHubCrawler
 
@@ -53,6 +56,230 @@ def test_extra_enrichment_languages(mock_get):
     langs = out2[0]["extra"]["language_stats"]
     assert langs and isinstance(langs, dict) and langs.get("Python") == 100.0
 
+@patch("requests.Session.get")
+def test_owner_enrichment_fetches_each_owner_once(mock_get):
+    search_html = """
+    <html><body>
+      <a href="/alice/one">1</a><a href="/alice/two">2</a><a href="/bob/three">3</a>
+    </body></html>
+    """
+    lang_li = "<li><span class='color-fg-default text-bold mr-1'>{}</span><span>{}%</span></li>"
+    repo_pages = {
+        "https://github.com/alice/one": "<ul>" + lang_li.format("Python", 100) + "</ul>",
+        "https://github.com/alice/two": "<ul>" + lang_li.format("Python", 50) + lang_li.format("Go", 50) + "</ul>",
+        "https://github.com/bob/three": "<p>no languages</p>",
+    }
+    owner_pages = {
+        "https://github.com/alice": "<a href='/alice?tab=followers'><span>12</span> followers</a>",
+        "https://github.com/bob": "<div itemtype='http://schema.org/Organization'></div>",
+    }
+
+    def side_effect(url, **kwargs):
+        m = Mock(); m.raise_for_status = Mock()
+        m.text = repo_pages.get(url) or owner_pages.get(url) or search_html
+        return m
+
+    mock_get.side_effect = side_effect
+    out = GitHubCrawler(mk(include_owners=True)).run()
+
+    fetched = [call.args[0] for call in mock_get.call_args_list]
+    assert sorted(u for u in fetched if u in owner_pages) == sorted(owner_pages)
+    assert len(fetched) == 1 + len(repo_pages) + len(owner_pages)
+
+    assert [x["url"] for x in out] == list(repo_pages)
+    alice = out[0]["extra"]["owner_profile"]
+    assert out[1]["extra"]["owner_profile"] is alice
+    assert alice == {
+        "login": "alice", "type": "User", "followers": 12, "public_repos": None,
+        "repos_in_results": 2, "language_stats": {"Python": 75.0, "Go": 25.0},
+    }
+    bob = out[2]["extra"]["owner_profile"]
+    assert bob["type"] == "Organization"
+    assert bob["repos_in_results"] == 1 and bob["language_stats"] == {}
+
+@patch("requests.Session.get")
+def test_owner_enrichment_skipped_for_non_repositories(mock_get):
+    resp = Mock(); resp.raise_for_status = Mock()
+    resp.text = "<a href='/u/r/issues/1'>i</a>"; mock_get.return_value = resp
+    out = GitHubCrawler(mk(type="Issues", include_owners=True)).run()
+    assert out == [{"url": "https://github.com/u/r/issues/1"}]
+    assert mock_get.call_count == 1
+
+@patch("requests.Session.get")
+def test_seen_store_skips_urls_from_previous_runs(mock_get, tmp_path):
+    pages = iter([
+        "<a href='/u/a'>a</a><a href='/u/b'>b</a>",
+        "<a href='/u/b'>b</a><a href='/u/c'>c</a>",
+    ])
+
+    def side_effect(url, **kwargs):
+        m = Mock(); m.raise_for_status = Mock()
+        m.text = next(pages) if "/search?" in url else "<p>repo</p>"
+        return m
+
+    mock_get.side_effect = side_effect
+    cfg = mk(include_extra=True, seen_store_kind="sqlite", seen_path=str(tmp_path / "seen.db"))
+
+    first = GitHubCrawler(cfg); out1 = first.run(); first.close()
+    second = GitHubCrawler(cfg); out2 = second.run(); second.close()
+
+    assert [x["url"] for x in out1] == ["https://github.com/u/a", "https://github.com/u/b"]
+    assert [x["url"] for x in out2] == ["https://github.com/u/c"]
+    repo_fetches = [c.args[0] for c in mock_get.call_args_list if "/search?" not in c.args[0]]
+    assert repo_fetches.count("https://github.com/u/b") == 1
+
+@patch("requests.Session.get")
+def test_warm_up_opens_connections_per_proxy(mock_get):
+    resp = Mock(); resp.raise_for_status = Mock(); resp.text = "<a href='/u/r'>r</a>"
+    mock_get.return_value = resp
+    cfg = mk(proxies=["1.2.3.4:8080", "https://5.6.7.8:3128"], warm_connections=3)
+
+    with patch.object(GitHubCrawler, "_open_warm_connection") as warm:
+        out = GitHubCrawler(cfg).run()
+
+    assert out == [{"url": "https://github.com/u/r"}]
+    warmed = [c.args[0]["https"] for c in warm.call_args_list]
+    assert sorted(warmed) == ["http://1.2.3.4:8080"] * 3 + ["https://5.6.7.8:3128"] * 3
+
+@pytest.mark.parametrize("dns_cache", [True, False])
+def test_warm_up_failing_route_makes_one_attempt_per_connection(dns_cache):
+    crawler = GitHubCrawler(mk(proxies=["127.0.0.1:9"], warm_connections=3, dns_cache=dns_cache))
+    with patch(
+        "urllib3.util.connection.create_connection", side_effect=ConnectionRefusedError("refused")
+    ) as create_connection:
+        crawler.warm_up()
+    assert create_connection.call_count == 3
+
+def test_warm_connection_is_reused_by_first_fetch(local_server):
+    crawler = GitHubCrawler(mk(proxies=None, warm_connections=1))
+    with patch("ghcrawler.crawler.WARM_UP_URL", local_server):
+        crawler.warm_up()
+    warmed = crawler.connection_stats()["pools"]["total"]
+    assert warmed["connections"] == 1 and warmed["requests"] == 1
+
+    assert crawler._fetch(local_server) == "ok"
+    after = crawler.connection_stats()["pools"]["total"]
+    assert after["connections"] == warmed["connections"]
+    assert after["requests"] == 2 and after["reuse_ratio"] > 0
+
+def test_warm_up_uses_environment_proxy_like_fetch(local_server, monkeypatch):
+    monkeypatch.setenv("HTTP_PROXY", local_server)
+    for name in ("NO_PROXY", "no_proxy", "http_proxy"):
+        monkeypatch.delenv(name, raising=False)
+    target = "http://example.test/"
+    crawler = GitHubCrawler(mk(proxies=None, warm_connections=1))
+    with patch("ghcrawler.crawler.WARM_UP_URL", target):
+        crawler.warm_up()
+    assert crawler._fetch(target) == "ok"
+
+    pools = crawler.connection_stats()["pools"]
+    assert "direct" not in pools
+    assert pools["total"] == {"requests": 2, "connections": 1, "reuse_ratio": 0.5}
+
+def test_warm_up_uses_same_pool_as_fetch_with_ca_bundle_env(monkeypatch):
+    import certifi
+    from urllib3.connectionpool import HTTPSConnectionPool
+    from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", certifi.where())
+    used_pools = []
+
+    def record_pool(pool, *args, **kwargs):
+        used_pools.append(pool)
+        raise Urllib3HTTPError("stop before any network I/O")
+
+    crawler = GitHubCrawler(mk(proxies=None, warm_connections=1))
+    with patch.object(HTTPSConnectionPool, "urlopen", autospec=True, side_effect=record_pool):
+        crawler.warm_up()
+        with pytest.raises(Urllib3HTTPError):
+            crawler._fetch("https://github.com/")
+
+    assert len(used_pools) == 2
+    assert used_pools[0] is used_pools[1]
+
+@patch("requests.Session.get")
+def test_warm_up_disabled_by_default(mock_get):
+    resp = Mock(); resp.raise_for_status = Mock(); resp.text = ""; mock_get.return_value = resp
+    crawler = GitHubCrawler(mk())
+    with patch.object(GitHubCrawler, "_open_warm_connection") as warm:
+        crawler.run()
+    warm.assert_not_called()
+    assert crawler.connection_stats()["dns"] == {"lookups": 0, "hits": 0}
+    assert "dns" not in GitHubCrawler(mk(dns_cache=False)).connection_stats()
+
+def _failing_enrichment_side_effect(fail_urls):
+    """Search page lists /u/a and /u/b; repo fetches for URLs in fail_urls raise."""
+    def side_effect(url, **kwargs):
+        if url in fail_urls:
+            raise requests.ConnectionError("boom")
+        m = Mock(); m.raise_for_status = Mock()
+        m.text = "<a href='/u/a'>a</a><a href='/u/b'>b</a>" if "/search?" in url else "<p>repo</p>"
+        return m
+    return side_effect
+
+@pytest.mark.parametrize("store", ["memory", "sqlite"])
+@patch("requests.Session.get")
+def test_failed_run_does_not_mark_urls_seen(mock_get, store, tmp_path):
+    fail_urls = {"https://github.com/u/b"}
+    mock_get.side_effect = _failing_enrichment_side_effect(fail_urls)
+    cfg = mk(include_extra=True, seen_store_kind=store, seen_path=str(tmp_path / "seen.db"))
+
+    crawler = GitHubCrawler(cfg)
+    with pytest.raises(RuntimeError, match="HTTP error"):
+        crawler.run()
+    fail_urls.clear()
+    assert [x["url"] for x in crawler.run()] == ["https://github.com/u/a", "https://github.com/u/b"]
+    crawler.close()
+
+@patch("requests.Session.get")
+def test_failed_run_not_committed_on_close(mock_get, tmp_path):
+    fail_urls = {"https://github.com/u/b"}
+    mock_get.side_effect = _failing_enrichment_side_effect(fail_urls)
+    cfg = mk(include_extra=True, seen_store_kind="sqlite", seen_path=str(tmp_path / "seen.db"))
+
+    crawler = GitHubCrawler(cfg)
+    with pytest.raises(RuntimeError):
+        crawler.run()
+    crawler.close()
+
+    fail_urls.clear()
+    fresh = GitHubCrawler(cfg)
+    assert len(fresh.run()) == 2
+    fresh.close()
+
+@patch("requests.Session.get")
+def test_runs_are_independent_without_seen_store(mock_get):
+    mock_get.side_effect = _failing_enrichment_side_effect(set())
+    crawler = GitHubCrawler(mk())
+    assert crawler.seen is None
+    assert crawler.run() == crawler.run() == [{"url": "https://github.com/u/a"}, {"url": "https://github.com/u/b"}]
+
+@patch("requests.Session.get")
+def test_memory_seen_store_dedups_across_runs_of_one_crawler(mock_get):
+    mock_get.side_effect = _failing_enrichment_side_effect(set())
+    crawler = GitHubCrawler(mk(seen_store_kind="memory"))
+    assert len(crawler.run()) == 2
+    assert crawler.run() == []
+
+@patch("requests.Session.get")
+def test_concurrent_crawlers_leave_socket_resolution_untouched(mock_get):
+    original = socket.getaddrinfo
+
+    def side_effect(url, **kwargs):
+        assert socket.getaddrinfo is original
+        m = Mock(); m.raise_for_status = Mock(); m.text = "<a href='/u/r'>r</a>"
+        return m
+
+    mock_get.side_effect = side_effect
+    crawlers = [GitHubCrawler(mk()), GitHubCrawler(mk())]
+    with ThreadPoolExecutor(max_workers=2) as tp:
+        outputs = list(tp.map(lambda c: c.run(), crawlers))
+
+    assert outputs == [[{"url": "https://github.com/u/r"}]] * 2
+    assert socket.getaddrinfo is original
+    adapters = [c.session.get_adapter("https://") for c in crawlers]
+    assert adapters[0].dns_cache is crawlers[0].dns_cache is not crawlers[1].dns_cache
+
 def test_invalid_search_type():
     """Test error handling for invalid search type (line 34)"""
     with pytest.raises(ValueError, match="Unsupported search type"):
@@ -72,6 +299,10 @@ def test_crawler_config_defaults():
     )
     assert config.timeout == 20
     assert config.include_extra is False
+    assert config.include_owners is False
+    assert config.warm_connections == 0
+    assert config.dns_cache is True
+    assert config.seen_store_kind is None
     assert "Chrome" in config.user_agent
 
 def test_crawler_config_custom_values():
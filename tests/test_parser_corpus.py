@@ -0,0 +1,207 @@
+"""Corpus-driven regression and throughput checks for the HTML parsers.
+
+Pages are generated synthetically (many anchors, deeply nested lists, large
+<ul> blocks) and mutation-fuzzed with a fixed seed, so runs are reproducible.
+Throughput checks time each parser at growing input sizes and fail when the
+observed growth is superlinear or a page blows its absolute time budget.
+"""
+import math
+import random
+import time
+
+import pytest
+
+from ghcrawler.parsers import extract_search_urls, parse_language_stats
+
+FUZZ_SEED = 1337
+FUZZ_VARIANTS = 40
+
+# Largest allowed log-log slope of parse time vs. input size; linear is ~1.0,
+# quadratic is ~2.0. The slack absorbs timer noise on shared CI runners.
+MAX_SCALING_EXPONENT = 1.5
+# Absolute wall-clock budget (seconds) for parsing one multi-megabyte page. The
+# default --cov addopts roughly double parse time, so this leaves room for tracing
+# while still catching a quadratic regression, which takes minutes at this size.
+LARGE_PAGE_BUDGET = 30.0
+TIMING_REPEATS = 3
+
+LANGUAGE_SPAN = "<span class='color-fg-default text-bold mr-1'>{name}</span>"
+
+
+def make_anchor_page(n_anchors):
+    """Search page with n repository anchors plus reserved-namespace and external noise."""
+    rows = []
+    for i in range(n_anchors):
+        rows.append(
+            f"<div class='result'><a href='/owner{i}/repo{i}?tab=readme#top'>repo{i}</a>"
+            f"<a href='/topics/t{i}'>topic</a><a href='//cdn.example.com/{i}'>cdn</a></div>"
+        )
+    return "<html><body>" + "".join(rows) + "</body></html>"
+
+
+def make_language_list_page(n_items):
+    """Repository page with one flat <ul> of n language entries."""
+    share = 100.0 / n_items
+    items = "".join(
+        f"<li>{LANGUAGE_SPAN.format(name=f'Lang{i}')}<span>{share:.4f}%</span></li>"
+        for i in range(n_items)
+    )
+    return f"<html><body><ul>{items}</ul></body></html>"
+
+
+def make_nested_list_page(depth):
+    """Repository page whose language <ul>s are nested `depth` levels deep."""
+    opening = "".join(
+        f"<ul><li>{LANGUAGE_SPAN.format(name=f'Lang{i}')}<span>1.0%</span>"
+        for i in range(depth)
+    )
+    return f"<html><body>{opening}{'</li></ul>' * depth}</body></html>"
+
+
+def mutate(html, rng):
+    """Return a randomly damaged copy of html (truncation, tag drops, junk, duplication)."""
+    ops = [
+        lambda s: s[: rng.randrange(len(s) + 1)],
+        lambda s: s.replace("</li>", "", rng.randint(1, 3)),
+        lambda s: s.replace("</a>", "", rng.randint(1, 3)),
+        lambda s: s.replace(">", ">" + rng.choice(["<", "&", "<<<", "<span>", "%"]), 1),
+        lambda s: s.replace("%", rng.choice(["", "%%", " %", "e9%"]), rng.randint(1, 3)),
+        lambda s: s.replace("href='", rng.choice(["href='//", "href='#", "href='?"]), 1),
+        lambda s: s * 2,
+    ]
+    for _ in range(rng.randint(1, 3)):
+        html = rng.choice(ops)(html)
+    return html
+
+
+def best_time(func, *args):
+    """Best-of-N wall time for func(*args), which is the least noisy estimate."""
+    best = math.inf
+    for _ in range(TIMING_REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_scaling(func, make_page, sizes):
+    """Time func at each size; return (log-log slope of time vs. page length, points).
+
+    Each point is (size, page bytes, best time in seconds).
+    """
+    points = []
+    for size in sizes:
+        html = make_page(size)
+        points.append((size, len(html), best_time(func, html)))
+    xs = [math.log(n_bytes) for _, n_bytes, _ in points]
+    ys = [math.log(max(seconds, 1e-6)) for _, _, seconds in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    num = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    den = sum((x - mean_x) ** 2 for x in xs)
+    return num / den, points
+
+
+def format_scaling_table(points):
+    """Render (size, bytes, seconds) points as a fixed-width table with us/KB per row."""
+    lines = [f"{'size':>8} {'bytes':>10} {'seconds':>10} {'us/KB':>8}"]
+    for size, n_bytes, seconds in points:
+        lines.append(f"{size:>8} {n_bytes:>10} {seconds:>10.4f} {seconds * 1e6 / (n_bytes / 1024):>8.1f}")
+    return "\n".join(lines)
+
+
+def validate_stats_shape(stats):
+    """Validate that parsed language stats are well-formed regardless of input quality."""
+    assert isinstance(stats, dict), "Language stats should be a dictionary"
+    for name, pct in stats.items():
+        assert isinstance(name, str), f"Language name should be str, got {name!r}"
+        assert 0 <= pct <= 100, f"Percentage out of range for {name}: {pct}"
+    if stats and sum(stats.values()) > 0:
+        assert abs(sum(stats.values()) - 100.0) < 0.5 * len(stats), "Stats should sum to ~100%"
+
+
+def search_repositories(html):
+    return extract_search_urls(html, "Repositories")
+
+
+def test_corpus_anchor_page_extracts_every_repo():
+    """Test that a large anchor page yields each repo once, with noise filtered out."""
+    urls = extract_search_urls(make_anchor_page(500), "Repositories")
+    assert urls == [f"https://github.com/owner{i}/repo{i}" for i in range(500)]
+
+
+def test_corpus_large_language_list():
+    """Test that a large flat <ul> keeps every entry and normalizes to 100%."""
+    stats = parse_language_stats(make_language_list_page(400))
+    assert len(stats) == 400
+    validate_stats_shape(stats)
+
+
+def test_corpus_nested_lists():
+    """Test that each nested <li> reports its own language, not a descendant's."""
+    stats = parse_language_stats(make_nested_list_page(60))
+    assert set(stats) == {f"Lang{i}" for i in range(60)}
+    validate_stats_shape(stats)
+
+
+@pytest.mark.parametrize("variant", range(FUZZ_VARIANTS))
+def test_fuzzed_pages_do_not_crash(variant):
+    """Test that mutated pages parse without raising and return well-formed output."""
+    rng = random.Random(FUZZ_SEED + variant)
+    seeds = [make_anchor_page(20), make_language_list_page(10), make_nested_list_page(10)]
+    html = mutate(rng.choice(seeds), rng)
+
+    urls = extract_search_urls(html, rng.choice(["Repositories", "Issues", "Wikis"]))
+    assert len(urls) == len(set(urls)), "Extracted URLs should be unique"
+    assert all(u.startswith("https://github.com/") for u in urls)
+    validate_stats_shape(parse_language_stats(html))
+
+
+@pytest.mark.parametrize(
+    "func, make_page, sizes",
+    [
+        (search_repositories, make_anchor_page, [250, 500, 1000, 2000]),
+        (parse_language_stats, make_language_list_page, [250, 500, 1000, 2000]),
+        (parse_language_stats, make_nested_list_page, [200, 400, 800, 1600]),
+    ],
+    ids=["anchors", "flat-ul", "nested-ul"],
+)
+def test_parse_time_scales_linearly(func, make_page, sizes, record_property):
+    """Test that parse time grows roughly linearly with input size.
+
+    The measured table is always reported (visible with -s, and stored as junit
+    properties) so drift under the budget can be tracked between runs.
+    """
+    exponent, points = measure_scaling(func, make_page, sizes)
+    table = format_scaling_table(points)
+    record_property("scaling_exponent", round(exponent, 3))
+    record_property("scaling_points", [(size, n_bytes, round(t, 6)) for size, n_bytes, t in points])
+    print(f"\n{func.__name__} on {make_page.__name__}: size^{exponent:.2f}\n{table}")
+
+    assert exponent <= MAX_SCALING_EXPONENT, (
+        f"{func.__name__} on {make_page.__name__} scales as size^{exponent:.2f}, "
+        f"budget is size^{MAX_SCALING_EXPONENT}\n{table}"
+    )
+
+
+@pytest.mark.parametrize(
+    "func, html",
+    [
+        (search_repositories, make_anchor_page(20000)),
+        (parse_language_stats, make_language_list_page(15000)),
+    ],
+    ids=["anchors", "flat-ul"],
+)
+def test_multi_megabyte_page_within_budget(func, html, record_property):
+    """Test that a multi-megabyte page parses within the absolute time budget."""
+    assert len(html) > 1_000_000, "Corpus page should be multi-megabyte"
+    start = time.perf_counter()
+    func(html)
+    elapsed = time.perf_counter() - start
+    record_property("page_bytes", len(html))
+    record_property("parse_seconds", round(elapsed, 4))
+    print(f"\n{func.__name__}: {len(html)} bytes in {elapsed:.2f}s")
+    assert elapsed <= LARGE_PAGE_BUDGET, (
+        f"{func.__name__} took {elapsed:.2f}s on {len(html)} bytes, budget {LARGE_PAGE_BUDGET}s"
+    )
+
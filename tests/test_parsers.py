@@ -2,9 +2,12 @@ from bs4 import BeautifulSoup
 
 from ghcrawler.parsers import (
     _extract_github_links,
+    _is_language_name,
     extract_search_urls,
     parse_language_stats,
+    parse_owner_profile,
 )
+from ghcrawler.selectors import LANGUAGE_NAME_SELECTOR
 
 SIMPLE_REPO_HTML = """
 <html>
@@ -206,6 +209,22 @@ def test_parse_language_stats_no_languages():
     expected = {}
     validate_language_stats(stats, expected)
 
+def test_language_name_match_agrees_with_selector():
+    """Test that the direct class check matches exactly what LANGUAGE_NAME_SELECTOR selects."""
+    html = """
+    <ul><li>
+        <span class="color-fg-default text-bold mr-1">Python</span>
+        <span class="text-bold mr-1 color-fg-default extra">Go</span>
+        <span class="color-fg-default text-bold">NoMargin</span>
+        <div class="color-fg-default text-bold mr-1">Div</div>
+        <span>12%</span>
+    </li></ul>
+    """
+    soup = create_soup(html)
+    selected = soup.select(LANGUAGE_NAME_SELECTOR)
+    assert [t.get_text() for t in selected] == ["Python", "Go"]
+    assert [t for t in soup.find_all(True) if _is_language_name(t)] == selected
+
 def test_extract_search_urls_empty_html():
     """Test URL extraction with empty HTML."""
     urls = extract_search_urls("", "Repositories")
@@ -243,4 +262,48 @@ def test_parse_language_stats_edge_cases():
     """
     stats_zero = parse_language_stats(html_zero)
     expected_zero = {"Python": 0.0}
-    validate_language_stats(stats_zero, expected_zero) 
+    validate_language_stats(stats_zero, expected_zero)
+
+
+USER_PROFILE_HTML = """
+<html>
+    <body>
+        <div itemscope itemtype="http://schema.org/Person">
+            <a href="https://github.com/octocat?tab=followers">
+                <span class="text-bold color-fg-default">1.2k</span> followers
+            </a>
+        </div>
+        <nav>
+            <a href="/octocat?tab=repositories">Repositories <span title="1,234" class="Counter">1.2k</span></a>
+        </nav>
+    </body>
+</html>
+"""
+
+ORG_PROFILE_HTML = """
+<html>
+    <body>
+        <div itemscope itemtype="http://schema.org/Organization">
+            <a href="/orgs/acme/followers"><span>87</span> followers</a>
+        </div>
+        <nav>
+            <a href="/orgs/acme/repositories">Repositories <span class="Counter">42</span></a>
+        </nav>
+    </body>
+</html>
+"""
+
+def test_parse_owner_profile_user():
+    """Test owner profile parsing for a user page, preferring exact counter titles."""
+    profile = parse_owner_profile(USER_PROFILE_HTML)
+    assert profile == {"type": "User", "followers": 1200, "public_repos": 1234}
+
+def test_parse_owner_profile_organization():
+    """Test owner profile parsing for an organization page."""
+    profile = parse_owner_profile(ORG_PROFILE_HTML)
+    assert profile == {"type": "Organization", "followers": 87, "public_repos": 42}
+
+def test_parse_owner_profile_missing_counts():
+    """Test owner profile parsing when no counters are present."""
+    profile = parse_owner_profile("<html><body><p>nothing here</p></body></html>")
+    assert profile == {"type": "User", "followers": None, "public_repos": None}
@@ -0,0 +1,88 @@
+import pytest
+
+from ghcrawler.seen_store import (
+    BloomSeenStore,
+    MemorySeenStore,
+    SeenStore,
+    SqliteSeenStore,
+    open_seen_store,
+)
+
+URLS = [f"https://github.com/owner{i}/repo{i}" for i in range(200)]
+
+
+def make_store(kind, tmp_path):
+    """Create a store of the given kind backed by a file under tmp_path when needed."""
+    if kind == "memory":
+        return MemorySeenStore()
+    if kind == "bloom":
+        return BloomSeenStore(path=str(tmp_path / "seen.bloom"), initial_capacity=50)
+    return SqliteSeenStore(str(tmp_path / "seen.sqlite"))
+
+
+@pytest.mark.parametrize("kind", ["memory", "bloom", "sqlite"])
+def test_add_reports_only_new_urls(kind, tmp_path):
+    """Test that add() is True exactly once per URL and membership follows."""
+    store = make_store(kind, tmp_path)
+    assert all(store.add(u) for u in URLS)
+    assert not any(store.add(u) for u in URLS)
+    assert all(u in store for u in URLS)
+    assert len(store) == len(URLS)
+    store.close()
+
+
+@pytest.mark.parametrize("kind", ["bloom", "sqlite"])
+def test_persistent_stores_survive_reopen(kind, tmp_path):
+    """Test that flushed URLs are still seen after reopening the store."""
+    store = make_store(kind, tmp_path)
+    for u in URLS:
+        store.add(u)
+    store.close()
+
+    reopened = make_store(kind, tmp_path)
+    assert all(u in reopened for u in URLS)
+    assert reopened.add("https://github.com/new/repo")
+
+
+def test_bloom_scales_and_keeps_error_rate(tmp_path):
+    """Test that the Bloom store grows past its initial capacity and stays under its error rate."""
+    store = BloomSeenStore(error_rate=0.01, initial_capacity=100)
+    for i in range(2000):
+        store.add(f"https://github.com/seen{i}/repo")
+    assert len(store._filters) > 1
+
+    false_positives = sum(f"https://github.com/unseen{i}/repo" in store for i in range(5000))
+    assert false_positives / 5000 < 0.01
+
+
+def test_bloom_rejects_mismatched_parameters(tmp_path):
+    """Test that reopening a Bloom file with different parameters fails loudly."""
+    path = str(tmp_path / "seen.bloom")
+    store = BloomSeenStore(path=path, error_rate=0.01)
+    store.add(URLS[0])
+    store.flush()
+    with pytest.raises(ValueError, match="was created with"):
+        BloomSeenStore(path=path, error_rate=0.001)
+
+
+def test_open_seen_store_validation(tmp_path):
+    """Test factory selection and its error handling."""
+    assert isinstance(open_seen_store("memory"), MemorySeenStore)
+    assert isinstance(open_seen_store("bloom", error_rate=0.05), BloomSeenStore)
+    assert isinstance(open_seen_store("sqlite", str(tmp_path / "s.db")), SqliteSeenStore)
+    with pytest.raises(ValueError, match="Unsupported seen store"):
+        open_seen_store("redis")
+    with pytest.raises(ValueError, match="requires a path"):
+        open_seen_store("sqlite")
+    with pytest.raises(ValueError, match="error rate"):
+        BloomSeenStore(error_rate=1.5)
+
+
+def test_seen_store_subclass_must_implement_abstract_methods():
+    """Test that an incomplete SeenStore subclass fails at instantiation."""
+    class Incomplete(SeenStore):
+        def add(self, url):
+            return True
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()